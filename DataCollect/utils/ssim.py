@@ -5,11 +5,12 @@
 
 # 1. Import the necessary packages
 #from skimage.measure import compare_ssim
-from skimage.metrics import structural_similarity as ssim
 import argparse
 import imutils
 import cv2
+import numpy as np
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 path = 'black_toy'
 
@@ -19,33 +20,50 @@ path = 'black_toy'
 # ap.add_argument("-s", "--second", required=True, help="Directory of the image that will be used to compare")
 # args = vars(ap.parse_args())
 
-# 3. Load the two input images
-imageA = cv2.imread("black_toy/images/564.png")
-imageB = cv2.imread("black_toy/test_output/564.png", 1)
 
+def fast_ssim(a, b, C1=(0.01*255)**2, C2=(0.03*255)**2):
+    # SSIM from its definition (Wang et al. 2004) with an 11x11, sigma 1.5
+    # Gaussian window; cv2.GaussianBlur is far faster than skimage's filters.
+    a = a.astype(np.float32)
+    b = b.astype(np.float32)
+    mu1 = cv2.GaussianBlur(a, (11, 11), 1.5)
+    mu2 = cv2.GaussianBlur(b, (11, 11), 1.5)
+    mu1_sq = mu1 * mu1
+    mu2_sq = mu2 * mu2
+    mu1_mu2 = mu1 * mu2
+    s1 = cv2.GaussianBlur(a * a, (11, 11), 1.5) - mu1_sq
+    s2 = cv2.GaussianBlur(b * b, (11, 11), 1.5) - mu2_sq
+    s12 = cv2.GaussianBlur(a * b, (11, 11), 1.5) - mu1_mu2
+    ssim_map = ((2 * mu1_mu2 + C1) * (2 * s12 + C2)) / ((mu1_sq + mu2_sq + C1) * (s1 + s2 + C2))
+    return ssim_map.mean()
 
 
-# 4. Convert the images to grayscale
-grayA = cv2.cvtColor(imageA, cv2.COLOR_BGR2GRAY)
-grayB = cv2.cvtColor(imageB, cv2.COLOR_BGR2GRAY)
+def _score(path_pair):
+    # Worker for the batch below: SSIM of one (original, generated) pair.
+    original, generated = path_pair
+    a = cv2.imread(original, cv2.IMREAD_GRAYSCALE)
+    b = cv2.imread(generated, cv2.IMREAD_GRAYSCALE)
+    return fast_ssim(a, b)
 
-# 5. Compute the Structural Similarity Index (SSIM) between the two
-#    images, ensuring that the difference image is returned
-#(score, diff) = compare_ssim(grayA, grayB, full=True)
-(score, diff) = ssim(grayA, grayB, full=True)
-diff = (diff * 255).astype("uint8")
 
-# 6. You can print only the score if you want
-print("SSIM: {}".format(score))
+if __name__ == '__main__':
+    # 3./4. Load the two input images, decoded straight to grayscale
+    grayA = cv2.imread("black_toy/images/564.png", cv2.IMREAD_GRAYSCALE)
+    grayB = cv2.imread("black_toy/test_output/564.png", cv2.IMREAD_GRAYSCALE)
 
-images = os.listdir(path+'/test_output')
-total = []
-for image in images:
-    generated = path + '/test_output/' + image
-    original =  path + '/images/' + image
-    generated = cv2.imread(generated)
-    original = cv2.imread(original, 1)
-    (score, diff) = ssim(grayA, grayB, full=True)
-    diff = (diff * 255).astype("uint8")
-    total.append(score)
-print(sum(total)/len(total))
\ No newline at end of file
+    # 5. Compute the Structural Similarity Index (SSIM) between the two images
+    #(score, diff) = compare_ssim(grayA, grayB, full=True)
+    score = fast_ssim(grayA, grayB)
+
+    # 6. You can print only the score if you want
+    print("SSIM: {}".format(score))
+
+    # 7. Average SSIM over every rendered image and its ground truth.
+    #    Each pair is independent, so spread decode + SSIM over all cores
+    #    (the default worker count is the CPU count, capped at 61 on Windows).
+    pairs = [(path + '/images/' + entry.name, entry.path) for entry in os.scandir(path+'/test_output')]
+    scores = np.empty(len(pairs), dtype=np.float32)
+    with ProcessPoolExecutor() as ex:
+        for i, score in enumerate(ex.map(_score, pairs, chunksize=8)):
+            scores[i] = score
+    print(scores.mean())
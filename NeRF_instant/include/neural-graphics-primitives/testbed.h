@@ -392,6 +392,7 @@ public:
 	float scale() const { return m_scale; }
 	vec3 ndi_rotation_matrix() const { return ndi_rotation; }
 	void set_ndi_rotation_matrix(const vec3& m_ndi_rotation);
+	void set_ndi_camera_matrix(const mat4x3& cam);
 	void set_scale(float scale);
 	vec3 view_pos() const { return m_camera[3]; }
 	vec3 view_dir() const { return m_camera[2]; }
@@ -140,9 +140,18 @@ def srgb_to_linear(img):
 	limit = 0.04045
 	return np.where(img > limit, np.power((img + 0.055) / 1.055, 2.4), img / 12.92)
 
-def linear_to_srgb(img):
+def linear_to_srgb(img, out=None):
 	limit = 0.0031308
-	return np.where(img > limit, 1.055 * (img ** (1.0 / 2.4)) - 0.055, 12.92 * img)
+	if out is None:
+		return np.where(img > limit, 1.055 * (img ** (1.0 / 2.4)) - 0.055, 12.92 * img)
+	# Same curve, written into `out` without temporaries of the image's size.
+	# Each element of img is read before it is overwritten, so out may be img.
+	mask = img > limit
+	np.power(img, 1.0 / 2.4, out=out, where=mask)
+	np.multiply(out, 1.055, out=out, where=mask)
+	np.subtract(out, 0.055, out=out, where=mask)
+	np.multiply(img, 12.92, out=out, where=~mask)
+	return out
 
 def read_image(file):
 	if os.path.splitext(file)[1] == ".bin":
@@ -205,6 +214,33 @@ def SSIM(a, b):
 	error = p1 * p2
 	return error
 
+def SSIM_torch(a, b):
+	# Same as SSIM() above, for (H,W,3) torch tensors on any device
+	import torch
+	import torch.nn.functional as F
+	k = torch.tensor([0.120078, 0.233881, 0.292082, 0.233881, 0.120078], dtype=a.dtype, device=a.device)
+	def blur(a):
+		# Pad like scipy's default "reflect" mode, which repeats the edge sample
+		x = a[None,None]
+		x = torch.cat([x[...,:2].flip(-1), x, x[...,-2:].flip(-1)], dim=-1)
+		x = F.conv2d(x, k.view(1,1,1,5))
+		x = torch.cat([x[...,:2,:].flip(-2), x, x[...,-2:,:].flip(-2)], dim=-2)
+		x = F.conv2d(x, k.view(1,1,5,1))
+		return x[0,0]
+	a = luminance(a)
+	b = luminance(b)
+	mA = blur(a)
+	mB = blur(b)
+	sA = blur(a*a) - mA**2
+	sB = blur(b*b) - mB**2
+	sAB = blur(a*b) - mA*mB
+	c1 = 0.01**2
+	c2 = 0.03**2
+	p1 = (2.0*mA*mB + c1)/(mA*mA + mB*mB + c1)
+	p2 = (2.0*sAB + c2)/(sA + sB + c2)
+	error = p1 * p2
+	return error
+
 def L1(img, ref):
 	return np.abs(img - ref)
 
@@ -260,6 +296,14 @@ def compute_error_img(metric, img, ref):
 
 	raise ValueError(f"Unknown metric: {metric}.")
 
+def compute_ssim_torch(img, ref):
+	# compute_error("SSIM", img, ref) for torch tensors. Returns a 0-dim tensor
+	# on the input's device so callers can accumulate without syncing.
+	import torch
+	img = torch.nan_to_num(img, nan=0.0, posinf=0.0, neginf=0.0).clamp(0.0, 1.0)
+	ssim_map = SSIM_torch(img, ref.clamp(0.0, 1.0))
+	return torch.nan_to_num(ssim_map, nan=0.0, posinf=0.0, neginf=0.0).mean()
+
 def compute_error(metric, img, ref):
 	metric_map = compute_error_img(metric, img, ref)
 	metric_map[np.logical_not(np.isfinite(metric_map))] = 0
@@ -31,15 +31,28 @@ import pickle
 from scipy.spatial.transform import Rotation as R
 
 import keyboard  # using module keyboard
-import csv
+from concurrent.futures import ThreadPoolExecutor
 
 import time
 
-def flip_matrix(m):
-	c2w = np.linalg.inv(m)
+def rigid_inv(m, out=None):
+	# Inverse of a rigid 4x4 transform: [R t]^-1 = [R^T -R^T t]
+	r = m[:3,:3]
+	if out is None:
+		out = np.empty((4,4))
+	out[:3,:3] = r.T
+	out[:3,3] = -r.T @ m[:3,3]
+	out[3] = (0,0,0,1)
+	return out
+
+_FLIP_BUF = np.empty((4,4))
+
+def flip_matrix(m, out=_FLIP_BUF):
+	# Writes into a shared buffer by default; copy the result to keep it across calls
+	c2w = rigid_inv(m, out=out)
 	c2w[0:3,2] *= -1 # flip the y and z axis
 	c2w[0:3,1] *= -1
-	c2w = c2w[[1,0,2,3],:]
+	c2w[[0,1],:] = c2w[[1,0],:]
 	c2w[2,:] *= -1 # flip whole world upside down
 	return c2w
 
@@ -84,16 +97,37 @@ def rotation_matrix_y(angle_deg):
     ])
 
 def calculate_relative_positions(base_pos, stream):
-    relative_stream = []
-    for i, data in stream:
-        # Assuming the last column of both base_pos and data arrays hold the relevant 3D positions
-        base_column = base_pos[:3, -1]
-        data_column = data[:3, -1]
-        
-        # Subtract the two columns to get the relative position
-        relative_data = data_column - base_column
-        relative_stream.append([i, list(relative_data)])
-    return relative_stream
+    # The last column of both base_pos and the stream matrices holds the 3D position
+    indices = [i for i, _ in stream]
+    data = np.stack([d for _, d in stream])
+    # Subtract the base position from every entry at once
+    relative_data = data[:, :3, -1] - base_pos[:3, -1]
+    return [[i, rel] for i, rel in zip(indices, relative_data.tolist())]
+
+def load_pickle(path):
+	with open(path, 'rb') as f:
+		return pickle.load(f)
+
+def load_cached_array(path, loader):
+	# Parse `path` with `loader` once and keep the result next to it as .npz, tagged
+	# with the source's (mtime, size). Later runs only use the cache on an exact match,
+	# so a restored or copied source with an older mtime is parsed again.
+	cache = os.path.splitext(path)[0] + ".npz"
+	st = os.stat(path)
+	source_id = np.array([st.st_mtime_ns, st.st_size], dtype=np.int64)
+	if os.path.exists(cache):
+		try:
+			with np.load(cache) as cached:
+				if np.array_equal(cached["source_id"], source_id):
+					return cached["arr"]
+		except (OSError, ValueError, KeyError):
+			pass # unreadable or old-format cache, rebuild it
+	arr = np.asarray(loader(path), dtype=float)
+	try:
+		np.savez(cache, arr=arr, source_id=source_id)
+	except OSError:
+		pass # read-only location, just skip the cache
+	return arr
 
 def parse_args():
 	parser = argparse.ArgumentParser(description="Run instant neural graphics primitives with additional configuration & output options")
@@ -277,25 +311,35 @@ if __name__ == "__main__":
 	
 	tqdm_last_update = 0
 	test_list = [[0,0,0],[0.2,0.2,0.2],[0.5,0.5,0.5]]
-	tool2camera = np.loadtxt(args.calibration, dtype=float, delimiter=',')
+	tool2camera = load_cached_array(args.calibration, lambda path: np.loadtxt(path, dtype=float, delimiter=','))
 	
 	camera2tool = np.linalg.inv(tool2camera)
-	with open(args.world_center, 'rb') as f:
-		world_center = pickle.load(f)
+	world_center = load_cached_array(args.world_center, load_pickle)
 
 	# with open(args.post_R, 'rb') as f:
 	# 	post_R = pickle.load(f)
 
        
-	with open(args.post_info, 'rb') as f:
-		post_avglen = pickle.load(f)
+	post_avglen = load_cached_array(args.post_info, load_pickle)
 
 	i = 0
 
 	base_pose = None
+	# Set by keyboard hooks, consumed (and cleared) by the frame loop
+	pressed = {'space': False, 'l': False}
 	if args.evaluation:
-		with open(args.base_pose, 'rb') as handle:
-			base_pose = pickle.load(handle)
+		base_pose = load_cached_array(args.base_pose, load_pickle)
+		keyboard.on_press_key('space', lambda e: pressed.__setitem__('space', True))
+		keyboard.on_press_key('l', lambda e: pressed.__setitem__('l', True))
+
+	# Loop invariants for the NDI view update
+	avg_post_avglen = float(sum(post_avglen)) / len(post_avglen)
+	ndi_scale = 4.0 / avg_post_avglen  # scale to "nerf sized"
+	rot_x45 = rotation_matrix_x(45)
+	ndi_right = world_center @ tool2camera
+	ndi_inv = np.empty((4,4))
+	ndi_tmp = np.empty((4,4))
+	ndi_transform = np.empty((4,4))
 		
 	testbed.usernum = args.user_id
 	# Define a list to store the relative position 
@@ -303,8 +347,10 @@ if __name__ == "__main__":
 	stream = []
 	j = 0
 	last_pressed_time = 0
-	key_held = False
-	pressnum_initialized = False
+	last_framenum = None
+	# testbed.pressnum mirrors j; only pushed to the testbed when j changes
+	pressnum = [0,0,0]
+	last_j = None
 
 	prev_timer_value = 0
 	start_time = None
@@ -315,147 +361,129 @@ if __name__ == "__main__":
 	if n_steps > 0:
 		with tqdm(desc="Training", total=n_steps, unit="steps") as t:
 			while testbed.frame():
-				if not pressnum_initialized:
-					testbed.pressnum = [0,0,0]
-					pressnum_initialized = True
 				# TODO: ndi controller
 				if args.gui and args.ndi:
 					port_handles, timestamps, framenumbers, tracking, quality = TRACKER.get_frame()
 
-					if not np.isnan(tracking[0][0][-1]):
-						transform_matrix = tracking[0]
-						# print("T1", transform_matrix)
-
-						# ####### 1. handeye calibration
-						transform_matrix = camera2tool @ np.linalg.inv(transform_matrix)
-						# print("T2", transform_matrix)
-						# ####### 2. use world center as origin ############
-						# print("tool2camera", tool2camera)
-						transform_matrix = transform_matrix @ world_center @ tool2camera
-						# print("T3", transform_matrix)
-
-						# # 1,2 Get right matix direction.
-
-						# transform_matrix = transform_matrix @ world_center
-						# print("T2", transform_matrix)
-						# ####### 3. flip matrix (from opencv to opengl and from w2c to c2w)
-						transform_matrix = flip_matrix(transform_matrix)
-						# # # ####### 4. add ....
-						# transform_matrix = np.matmul(post_R, transform_matrix)
-                        # # # # ####### 5.
-						# transform_matrix[0:3, 3] -= post_totp
-                        # # # ####### 6.
-						avg_post_avglen = sum(post_avglen) / len(post_avglen)
-						# print("T4", transform_matrix)
-						transform_matrix[0:3, 3] *= 4.0 / avg_post_avglen  # scale to "nerf sized"
-						#transform_matrix = transform_matrix.tolist()
-						# print(transform_matrix)
-						tran_vec = transform_matrix[[0,1,2],-1]
-						center = [0.5,-0.50478,0]
-
-						
-						
-						# if keyboard.is_pressed('k'):
-						
-
+					tracked = not np.isnan(tracking[0][0][-1])
+					if not tracked:
+						# Drop presses while the tool is lost (as polling did), so a point
+						# is never recorded with the pose seen once tracking comes back
+						pressed['space'] = False
+						pressed['l'] = False
 
+					if tracked:
+						now = time.time()
 						if args.evaluation:
 							# Detect a change in testbed.timer value
 							if testbed.timer != prev_timer_value:
 								if start_time is not None:  # Check if there's already a time being recorded
-									times_recorded.append(time.time() - start_time)  # Store the duration for the previous timer value
-								start_time = time.time()  # Start a new recording
+									times_recorded.append(now - start_time)  # Store the duration for the previous timer value
+								start_time = now  # Start a new recording
 								prev_timer_value = testbed.timer  # Update the previous timer value
 
-							if keyboard.is_pressed('l'):
-								testbed.pressnum = [0,0,0]  # Reset pressnum to [0,0,0]
-								j = 0  # Reset any related counters
-								testbed.pressnum = [j,0,0]
-
-							if keyboard.is_pressed(' '):
-								if keyboard.is_pressed(' ') and (time.time() - last_pressed_time >= 0.5):
-									if not key_held:
-										x = np.array([
-										[1.79233051e-01, 7.81816542e-02, 9.80695234e-01, 2.69621530e+02],
-										[2.05724419e-01, -9.77777731e-01, 4.03506246e-02, -2.86812080e+00],
-										[9.62056639e-01, 1.94520791e-01, -1.91333961e-01, -6.97097727e+01],
-										[0.00000000e+00, 0.00000000e+00, 0.00000000e+00, 1.00000000e+00]
-										])
-										transformed_data = tracking[0] @ x
-										stream = [[j, transformed_data]]
-										print('stream', stream)
-										
-										relative_stream = calculate_relative_positions(np.array(base_pose), stream)  # Converted base_pos to a NumPy array
-										print(f"Relative stream: {relative_stream}")
-										stream_list.append(relative_stream)
-										print('Updated stream_list:', stream_list)  # Print the updated stream_list
-										j = j+1
-										press_count += 1
-										# Check if space has been pressed 10 times
-										if press_count % 10 == 0:
-											if start_time is not None:
-												times_recorded.append(time.time() - start_time)  # Store the duration
-												start_time = None  # Reset start_time
-
-										testbed.pressnum = [j,0,0]
-										key_held = True
-										last_pressed_time = time.time()
-									else:
-										key_held = False
-						time_duration = 0 if start_time is None else time.time() - start_time
+							if pressed['l']:
+								pressed['l'] = False
+								j = 0  # Reset pressnum and any related counters
+
+							if pressed['space']:
+								pressed['space'] = False
+								if now - last_pressed_time >= 0.5:
+									x = np.array([
+									[1.79233051e-01, 7.81816542e-02, 9.80695234e-01, 2.69621530e+02],
+									[2.05724419e-01, -9.77777731e-01, 4.03506246e-02, -2.86812080e+00],
+									[9.62056639e-01, 1.94520791e-01, -1.91333961e-01, -6.97097727e+01],
+									[0.00000000e+00, 0.00000000e+00, 0.00000000e+00, 1.00000000e+00]
+									])
+									transformed_data = tracking[0] @ x
+									stream = [[j, transformed_data]]
+									print('stream', stream)
+									
+									relative_stream = calculate_relative_positions(base_pose, stream)
+									print(f"Relative stream: {relative_stream}")
+									stream_list.append(relative_stream)
+									print('Updated stream_list:', stream_list)  # Print the updated stream_list
+									j = j+1
+									press_count += 1
+									# Check if space has been pressed 10 times
+									if press_count % 10 == 0:
+										if start_time is not None:
+											times_recorded.append(now - start_time)  # Store the duration
+											start_time = None  # Reset start_time
+
+									last_pressed_time = now
+						time_duration = 0 if start_time is None else now - start_time
 						testbed.tasktime = time_duration
 						#print("time go: ", time_duration)
 						print("time: ", times_recorded)
-						testbed.look_at = [center[0] + tran_vec[1]/289.13, 0.5 + tran_vec[2]*0.0036754 , 0.5 + tran_vec[0]/313.7255]
-						# print("camera_look_at: ", testbed.camera_matrix)
-						# Extract translation
-						translation = transform_matrix[:3,3]
-					
-						# Set view rotation with ? axis and 30 degrees
-						rot_matrix_x = rotation_matrix_x(45)
-						rot_matrix_y = rotation_matrix_y(45)
-						rot_matrix_z = rotation_matrix_z(45)
-						# The rotation matrix part
-						rotation_matrix = transform_matrix[:3,:3]
-						# Change the view if observation
-						rotation_matrix = rotation_matrix @ rot_matrix_x
-						vector = rotation_matrix_to_vector(rotation_matrix)
-						testbed.view_dir = vector
-						# print("camera_view_dir: ", testbed.camera_matrix)
-
-						#Get up_dir
-						vector_up = [rotation_matrix[1, 1], rotation_matrix[2, 1],rotation_matrix[0, 1]]
-						testbed.up_dir = vector_up
-
-						testbed.scale = 1.025
-						k = testbed.camera_matrix
-						# print("Transfer: ", k)
-						k4 = k[:, -1]
-						k1 = k[:, 0]
-						k2 = k[:, 1]
-						k3 = k[:, 2]
-						testbed.ndi_rotation = k4
-						testbed.ndi_camera_1 = k1
-						testbed.ndi_camera_2 = k2
-						testbed.ndi_camera_3 = k3
-						# print("First Person View")
-						testbed.look_at = [center[0] + tran_vec[1]/289.13, 0.5 + tran_vec[2]*0.0036754 , 0.5 + tran_vec[0]/313.7255]
-						# print("camera_look_at1: ", testbed.camera_matrix)
-						# Extract translation
-						translation = transform_matrix[:3,3]
-						# The rotation matrix part
-						rotation_matrix = transform_matrix[:3,:3]
-						# print("R1", rotation_matrix)
-						vector = rotation_matrix_to_vector(rotation_matrix)
-						testbed.view_dir = vector
-						# print("camera_view_dir1: ", testbed.camera_matrix)
-						# print("Final: ", testbed.camera_matrix)
-						# print("Origin vector:", vector)
-						#Get up_dir
-						vector_up = [rotation_matrix[1, 1], rotation_matrix[2, 1],rotation_matrix[0, 1]]
-						testbed.up_dir = vector_up
-						testbed.scale = tran_vec[2]*0.0036754*0.4
-						testbed.reset_accumulation()
+
+						# The pose only changes when the tracker delivers a new frame
+						if framenumbers[0] != last_framenum:
+							last_framenum = framenumbers[0]
+							# print("T1", tracking[0])
+
+							# ####### 1. handeye calibration
+							np.matmul(camera2tool, rigid_inv(tracking[0], out=ndi_inv), out=ndi_tmp)
+							# print("T2", ndi_tmp)
+							# ####### 2. use world center as origin (ndi_right = world_center @ tool2camera) ############
+							transform_matrix = np.matmul(ndi_tmp, ndi_right, out=ndi_transform)
+							# print("T3", transform_matrix)
+
+							# # 1,2 Get right matix direction.
+
+							# transform_matrix = transform_matrix @ world_center
+							# print("T2", transform_matrix)
+							# ####### 3. flip matrix (from opencv to opengl and from w2c to c2w)
+							transform_matrix = flip_matrix(transform_matrix)
+							# # # ####### 4. add ....
+							# transform_matrix = np.matmul(post_R, transform_matrix)
+	                        # # # # ####### 5.
+							# transform_matrix[0:3, 3] -= post_totp
+	                        # # # ####### 6.
+							# print("T4", transform_matrix)
+							transform_matrix[0:3, 3] *= ndi_scale
+							#transform_matrix = transform_matrix.tolist()
+							# print(transform_matrix)
+							tran_vec = transform_matrix[[0,1,2],-1]
+							center = [0.5,-0.50478,0]
+
+						
+						
+							# if keyboard.is_pressed('k'):
+
+							testbed.look_at = [center[0] + tran_vec[1]/289.13, 0.5 + tran_vec[2]*0.0036754 , 0.5 + tran_vec[0]/313.7255]
+							# print("camera_look_at: ", testbed.camera_matrix)
+
+							# The rotation matrix part
+							rotation_matrix = transform_matrix[:3,:3]
+							# Change the view if observation: rotate 45 degrees about x
+							rotation_matrix = rotation_matrix @ rot_x45
+							vector = rotation_matrix_to_vector(rotation_matrix)
+							testbed.view_dir = vector
+							# print("camera_view_dir: ", testbed.camera_matrix)
+
+							#Get up_dir
+							vector_up = [rotation_matrix[1, 1], rotation_matrix[2, 1],rotation_matrix[0, 1]]
+							testbed.up_dir = vector_up
+
+							testbed.scale = 1.025
+							# Columns 0-2 go to ndi_camera_1..3, column 3 to ndi_rotation
+							testbed.set_ndi_camera_matrix(testbed.camera_matrix)
+							# print("First Person View")
+							# look_at is kept by the view_dir/up_dir/scale setters, so it is only set once above
+							# The rotation matrix part
+							rotation_matrix = transform_matrix[:3,:3]
+							# print("R1", rotation_matrix)
+							vector = rotation_matrix_to_vector(rotation_matrix)
+							testbed.view_dir = vector
+							# print("camera_view_dir1: ", testbed.camera_matrix)
+							# print("Final: ", testbed.camera_matrix)
+							# print("Origin vector:", vector)
+							#Get up_dir
+							vector_up = [rotation_matrix[1, 1], rotation_matrix[2, 1],rotation_matrix[0, 1]]
+							testbed.up_dir = vector_up
+							testbed.scale = tran_vec[2]*0.0036754*0.4
+							testbed.reset_accumulation()
 							
 
 						# else:
@@ -505,6 +533,11 @@ if __name__ == "__main__":
 						# TODO: change testbed.look_at/ testbed.view_dir/ testbed.scale and add constrain to the view
 						# TODO: compare the camera ground truth with the generated viewpoint
 
+				if j != last_j:
+					pressnum[0] = j
+					testbed.pressnum = pressnum
+					last_j = j
+
 				if testbed.want_repl():
 					repl(testbed)
 				# What will happen when training is done?
@@ -526,10 +559,11 @@ if __name__ == "__main__":
 					old_training_step = testbed.training_step
 					tqdm_last_update = now
 
-	with open(args.evaluation_list, 'w', newline='') as file:
-		writer = csv.writer(file)
-		writer.writerows(stream_list)
-		writer.writerows([[time] for time in times_recorded])
+	# One "index,x,y,z" row per recorded point, followed by one row per recorded time
+	with open(args.evaluation_list, 'w') as file:
+		points = np.array([(idx, *pos) for frame in stream_list for idx, pos in frame], dtype=float).reshape(-1, 4)
+		np.savetxt(file, points, delimiter=',', fmt=['%d', '%.6f', '%.6f', '%.6f'])
+		np.savetxt(file, np.array(times_recorded, dtype=float).reshape(-1, 1), delimiter=',', fmt='%.6f')
 
 	if args.save_snapshot:
 		testbed.save_snapshot(args.save_snapshot, False)
@@ -543,8 +577,6 @@ if __name__ == "__main__":
 		totpsnr = 0
 		totssim = 0
 		totcount = 0
-		minpsnr = 1000
-		maxpsnr = 0
 
 		# Evaluate metrics on black background
 		testbed.background_color = [0.0, 0.0, 0.0, 1.0]
@@ -558,7 +590,37 @@ if __name__ == "__main__":
 
 		testbed.shall_train = False
 		testbed.load_training_data(args.test_transforms)
+		psnrs = np.empty(testbed.nerf.training.dataset.n_images, np.float64)
+
+		# Compute SSIM on the GPU when PyTorch with CUDA is available
+		try:
+			import torch
+			ssim_device = "cuda" if torch.cuda.is_available() else None
+		except ModuleNotFoundError:
+			ssim_device = None
+		if ssim_device:
+			totssim = torch.zeros((), device=ssim_device)
+
+		# sRGB buffers reused across frames, reallocated when the resolution changes.
+		# Only the single metrics worker touches them.
+		srgb_bufs = {}
+
+		def image_metrics(image, ref_image):
+			shape = image.shape[:2] + (3,)
+			if srgb_bufs.get("shape") != shape:
+				srgb_bufs.update(shape=shape, A=np.empty(shape, np.float32), R=np.empty(shape, np.float32))
+			A = np.clip(linear_to_srgb(image[...,:3], out=srgb_bufs["A"]), 0.0, 1.0, out=srgb_bufs["A"])
+			R = np.clip(linear_to_srgb(ref_image[...,:3], out=srgb_bufs["R"]), 0.0, 1.0, out=srgb_bufs["R"])
+			mse = float(compute_error("MSE", A, R))
+			if ssim_device:
+				ssim = compute_ssim_torch(torch.from_numpy(A).to(ssim_device), torch.from_numpy(R).to(ssim_device))
+			else:
+				ssim = float(compute_error("SSIM", A, R))
+			return mse, ssim
 
+		# Metrics of frame i are computed on a worker thread while frame i+1 renders
+		metrics_pool = ThreadPoolExecutor(max_workers=1)
+		pending = []
 		with tqdm(range(testbed.nerf.training.dataset.n_images), unit="images", desc=f"Rendering test frame") as t:
 			for i in t:
 				resolution = testbed.nerf.training.dataset.metadata[i].resolution
@@ -576,23 +638,24 @@ if __name__ == "__main__":
 					diffimg[...,3:4] = 1.0
 					write_image("diff.png", diffimg)
 
-				A = np.clip(linear_to_srgb(image[...,:3]), 0.0, 1.0)
-				R = np.clip(linear_to_srgb(ref_image[...,:3]), 0.0, 1.0)
-				mse = float(compute_error("MSE", A, R))
-				ssim = float(compute_error("SSIM", A, R))
-				totssim += ssim
-				totmse += mse
-				psnr = mse2psnr(mse)
-				totpsnr += psnr
-				minpsnr = psnr if psnr<minpsnr else minpsnr
-				maxpsnr = psnr if psnr>maxpsnr else maxpsnr
-				totcount = totcount+1
-				t.set_postfix(psnr = totpsnr/(totcount or 1))
+				pending.append(metrics_pool.submit(image_metrics, image, ref_image))
+				# Collect the previous frame's metrics, and drain everything after the last frame
+				while len(pending) > 1 or (pending and i == t.total - 1):
+					mse, ssim = pending.pop(0).result()
+					totssim += ssim
+					totmse += mse
+					psnr = mse2psnr(mse)
+					psnrs[totcount] = psnr
+					totpsnr += psnr # running sum for the progress bar only
+					totcount = totcount+1
+					t.set_postfix(psnr = totpsnr/totcount)
+		metrics_pool.shutdown()
 
 		psnr_avgmse = mse2psnr(totmse/(totcount or 1))
-		psnr = totpsnr/(totcount or 1)
-		ssim = totssim/(totcount or 1)
-		print(f"PSNR={psnr} [min={minpsnr} max={maxpsnr}] SSIM={ssim}")
+		psnrs = psnrs[:totcount]
+		psnr = psnrs.mean() if totcount else 0
+		ssim = float(totssim)/(totcount or 1)
+		print(f"PSNR={psnr} [min={psnrs.min(initial=1000)} max={psnrs.max(initial=0)}] SSIM={ssim}")
 
 	if args.save_mesh:
 		res = args.marching_cubes_res or 256
@@ -639,6 +702,13 @@ if __name__ == "__main__":
 			shutil.rmtree("tmp")
 		os.makedirs("tmp")
 
+		# Encode frames on background threads while the next one renders (render()
+		# releases the GIL). At most 8 frames are in flight, independent of the core count.
+		io_pool = ThreadPoolExecutor(max_workers=4)
+		io_max_pending = 8
+		io_pending = []
+		exposure_scale = 2.0**args.exposure
+
 		for i in tqdm(list(range(min(n_frames, n_frames+1))), unit="frames", desc=f"Rendering video"):
 			testbed.camera_smoothing = args.video_camera_smoothing
 
@@ -653,10 +723,20 @@ if __name__ == "__main__":
 				continue
 
 			frame = testbed.render(resolution[0], resolution[1], args.video_spp, True, float(i)/n_frames, float(i + 1)/n_frames, args.video_fps, shutter_fraction=0.5)
+			# Apply exposure in place; render() hands back a fresh array every frame
+			if exposure_scale != 1.0:
+				np.multiply(frame, exposure_scale, out=frame)
+			np.clip(frame, 0.0, 1.0, out=frame)
+			if len(io_pending) >= io_max_pending:
+				io_pending.pop(0).result()
 			if save_frames:
-				write_image(args.video_output % i, np.clip(frame * 2**args.exposure, 0.0, 1.0), quality=100)
+				io_pending.append(io_pool.submit(write_image, args.video_output % i, frame, quality=100))
 			else:
-				write_image(f"tmp/{i:04d}.jpg", np.clip(frame * 2**args.exposure, 0.0, 1.0), quality=100)
+				io_pending.append(io_pool.submit(write_image, f"tmp/{i:04d}.jpg", frame, quality=100))
+
+		for future in io_pending:
+			future.result()
+		io_pool.shutdown()
 
 		if not save_frames:
 			os.system(f"ffmpeg -y -framerate {args.video_fps} -i tmp/%04d.jpg -c:v libx264 -pix_fmt yuv420p {args.video_output}")
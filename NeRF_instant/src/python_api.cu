@@ -125,82 +125,88 @@ pybind11::dict Testbed::compute_marching_cubes_mesh(ivec3 res3d, BoundingBox aab
 }
 
 py::array_t<float> Testbed::render_to_cpu(int width, int height, int spp, bool linear, float start_time, float end_time, float fps, float shutter_fraction) {
-	m_windowless_render_surface.resize({width, height});
-	m_windowless_render_surface.reset_accumulation();
+	// Allocate the output while holding the GIL, then release it only for the render and
+	// the device-to-host copy so that other Python threads can run in the meantime.
+	py::array_t<float> result({height, width, 4});
+	py::buffer_info buf = result.request();
+	{
+		py::gil_scoped_release release;
 
-	if (end_time < 0.f) {
-		end_time = start_time;
-	}
+		m_windowless_render_surface.resize({width, height});
+		m_windowless_render_surface.reset_accumulation();
 
-	bool path_animation_enabled = start_time >= 0.f;
-	if (!path_animation_enabled) { // the old code disabled camera smoothing for non-path renders; so we preserve that behaviour
-		m_smoothed_camera = m_camera;
-	}
+		if (end_time < 0.f) {
+			end_time = start_time;
+		}
 
-	// this rendering code assumes that the intra-frame camera motion starts from m_smoothed_camera (ie where we left off) to allow for EMA camera smoothing.
-	// in the case of a camera path animation, at the very start of the animation, we have yet to initialize smoothed_camera to something sensible
-	// - it will just be the default boot position. oops!
-	// that led to the first frame having a crazy streak from the default camera position to the start of the path.
-	// so we detect that case and explicitly force the current matrix to the start of the path
-	if (start_time == 0.f) {
-		set_camera_from_time(start_time);
-		m_smoothed_camera = m_camera;
-	}
+		bool path_animation_enabled = start_time >= 0.f;
+		if (!path_animation_enabled) { // the old code disabled camera smoothing for non-path renders; so we preserve that behaviour
+			m_smoothed_camera = m_camera;
+		}
 
-	auto start_cam_matrix = m_smoothed_camera;
+		// this rendering code assumes that the intra-frame camera motion starts from m_smoothed_camera (ie where we left off) to allow for EMA camera smoothing.
+		// in the case of a camera path animation, at the very start of the animation, we have yet to initialize smoothed_camera to something sensible
+		// - it will just be the default boot position. oops!
+		// that led to the first frame having a crazy streak from the default camera position to the start of the path.
+		// so we detect that case and explicitly force the current matrix to the start of the path
+		if (start_time == 0.f) {
+			set_camera_from_time(start_time);
+			m_smoothed_camera = m_camera;
+		}
 
-	// now set up the end-of-frame camera matrix if we are moving along a path
-	if (path_animation_enabled) {
-		set_camera_from_time(end_time);
-		apply_camera_smoothing(1000.f / fps);
-	}
+		auto start_cam_matrix = m_smoothed_camera;
 
-	auto end_cam_matrix = m_smoothed_camera;
-	auto prev_camera_matrix = m_smoothed_camera;
+		// now set up the end-of-frame camera matrix if we are moving along a path
+		if (path_animation_enabled) {
+			set_camera_from_time(end_time);
+			apply_camera_smoothing(1000.f / fps);
+		}
 
-	for (int i = 0; i < spp; ++i) {
-		float start_alpha = ((float)i)/(float)spp * shutter_fraction;
-		float end_alpha = ((float)i + 1.0f)/(float)spp * shutter_fraction;
+		auto end_cam_matrix = m_smoothed_camera;
+		auto prev_camera_matrix = m_smoothed_camera;
 
-		auto sample_start_cam_matrix = start_cam_matrix;
-		auto sample_end_cam_matrix = camera_log_lerp(start_cam_matrix, end_cam_matrix, shutter_fraction);
-		if (i == 0) {
-			prev_camera_matrix = sample_start_cam_matrix;
-		}
+		for (int i = 0; i < spp; ++i) {
+			float start_alpha = ((float)i)/(float)spp * shutter_fraction;
+			float end_alpha = ((float)i + 1.0f)/(float)spp * shutter_fraction;
 
-		if (path_animation_enabled) {
-			set_camera_from_time(start_time + (end_time-start_time) * (start_alpha + end_alpha) / 2.0f);
-			m_smoothed_camera = m_camera;
-		}
+			auto sample_start_cam_matrix = start_cam_matrix;
+			auto sample_end_cam_matrix = camera_log_lerp(start_cam_matrix, end_cam_matrix, shutter_fraction);
+			if (i == 0) {
+				prev_camera_matrix = sample_start_cam_matrix;
+			}
 
-		if (m_autofocus) {
-			autofocus();
-		}
+			if (path_animation_enabled) {
+				set_camera_from_time(start_time + (end_time-start_time) * (start_alpha + end_alpha) / 2.0f);
+				m_smoothed_camera = m_camera;
+			}
 
-		render_frame(
-			m_stream.get(),
-			sample_start_cam_matrix,
-			sample_end_cam_matrix,
-			prev_camera_matrix,
-			m_screen_center,
-			m_relative_focal_length,
-			{0.0f, 0.0f, 0.0f, 1.0f},
-			{},
-			{},
-			m_visualized_dimension,
-			m_windowless_render_surface,
-			!linear
-		);
-		prev_camera_matrix = sample_start_cam_matrix;
-	}
+			if (m_autofocus) {
+				autofocus();
+			}
 
-	// For cam smoothing when rendering the next frame.
-	m_smoothed_camera = end_cam_matrix;
+			render_frame(
+				m_stream.get(),
+				sample_start_cam_matrix,
+				sample_end_cam_matrix,
+				prev_camera_matrix,
+				m_screen_center,
+				m_relative_focal_length,
+				{0.0f, 0.0f, 0.0f, 1.0f},
+				{},
+				{},
+				m_visualized_dimension,
+				m_windowless_render_surface,
+				!linear
+			);
+			prev_camera_matrix = sample_start_cam_matrix;
+		}
 
-	py::array_t<float> result({height, width, 4});
-	py::buffer_info buf = result.request();
+		// For cam smoothing when rendering the next frame.
+		m_smoothed_camera = end_cam_matrix;
+
+		CUDA_CHECK_THROW(cudaMemcpy2DFromArray(buf.ptr, width * sizeof(float) * 4, m_windowless_render_surface.surface_provider().array(), 0, 0, width * sizeof(float) * 4, height, cudaMemcpyDeviceToHost));
+	}
 
-	CUDA_CHECK_THROW(cudaMemcpy2DFromArray(buf.ptr, width * sizeof(float) * 4, m_windowless_render_surface.surface_provider().array(), 0, 0, width * sizeof(float) * 4, height, cudaMemcpyDeviceToHost));
 	return result;
 }
 
@@ -533,6 +539,7 @@ PYBIND11_MODULE(pyngp, m) {
 		.def_readwrite("ndi_camera_1", &Testbed::ndi_camera_1)
 		.def_readwrite("ndi_camera_2", &Testbed::ndi_camera_2)
 		.def_readwrite("ndi_camera_3", &Testbed::ndi_camera_3)
+		.def("set_ndi_camera_matrix", &Testbed::set_ndi_camera_matrix, "Set ndi_camera_1..3 and ndi_rotation from the columns of a 4x3 camera matrix.")
 		.def_readwrite("pressnum", &Testbed::pressnum)
 		.def_readwrite("usernum", &Testbed::usernum)
 		.def_readwrite("timer", &Testbed::timer)
@@ -429,6 +429,13 @@ void Testbed::set_ndi_rotation_matrix(const vec3& m_ndi_rotation) {
 	ndi_rotation = m_ndi_rotation;
 }
 
+void Testbed::set_ndi_camera_matrix(const mat4x3& cam) {
+	ndi_camera_1 = cam[0];
+	ndi_camera_2 = cam[1];
+	ndi_camera_3 = cam[2];
+	ndi_rotation = cam[3];
+}
+
 void Testbed::set_view_dir(const vec3& dir) {
 	std::cout << "frame2:" << std::endl;
 	for (int i = 0; i < 3; ++i) {